@@ -0,0 +1,571 @@
+import datetime
+import itertools
+import numbers
+import os
+import re
+import sys
+from jsonschema import FormatChecker, draft7_format_checker
+from jsonschema.validators import Draft7Validator
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover
+    fastjsonschema = None
+
+try:
+    import jsonschema_rs
+except ImportError:  # pragma: no cover
+    jsonschema_rs = None
+
+# What compile_schema builds the fast checks with: "jsonene" generates them
+# here and leaves unsupported schemas to jsonschema, "fastjsonschema" and
+# "jsonschema-rs" use those libraries for every schema, "jsonschema" turns
+# the fast checks off.
+BACKENDS = ("jsonene", "fastjsonschema", "jsonschema-rs", "jsonschema")
+BACKEND = os.environ.get("JSONENE_BACKEND", "jsonene")
+
+# Keywords which only annotate a schema and never fail an instance.
+ANNOTATION_KEYWORDS = frozenset(
+    {"$schema", "$id", "$comment", "title", "description", "default", "examples"}
+)
+
+# Draft 7 keywords the generated code does not implement, schemas using
+# them are left to jsonschema.
+UNSUPPORTED_KEYWORDS = frozenset({"$ref", "if", "patternProperties", "propertyNames"})
+
+TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "integer": "(isinstance({v}, int) and {v}.__class__ is not bool)",
+    "number": "(isinstance({v}, (int, float)) and {v}.__class__ is not bool)",
+    "boolean": "{v}.__class__ is bool",
+    "null": "{v} is None",
+}
+
+# Keywords whose check costs a lookup or a len() call run first, in this
+# order, so an invalid instance is usually rejected before any per-item or
+# per-property work. The rest keep their schema order.
+CHEAP_KEYWORDS = (
+    "type",
+    "const",
+    "required",
+    "minProperties",
+    "maxProperties",
+    "minItems",
+    "maxItems",
+    "minLength",
+    "maxLength",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+)
+_KEYWORD_ORDER = {keyword: i for i, keyword in enumerate(CHEAP_KEYWORDS)}
+
+# Keywords simple enough to be fused into a single expression, mapped to
+# the type group they apply to and the comparison against their value.
+INLINE_KEYWORDS = {
+    "minLength": ("string", "len({v}) >= {k}"),
+    "maxLength": ("string", "len({v}) <= {k}"),
+    "minimum": ("number", "{v} >= {k}"),
+    "maximum": ("number", "{v} <= {k}"),
+    "exclusiveMinimum": ("number", "{v} > {k}"),
+    "exclusiveMaximum": ("number", "{v} < {k}"),
+}
+
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+_MISSING = object()
+
+
+class UnsupportedSchema(Exception):
+    pass
+
+
+def _always(value):
+    return True
+
+
+def _never(value):
+    return False
+
+
+def _equal(one, two):
+    # stricter than jsonschema: True/False never equal 1/0, at any depth
+    if one.__class__ is bool or two.__class__ is bool:
+        return one is two
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(map(_equal, one, two))
+    return one == two
+
+
+def _same(one, two):
+    # looser than jsonschema: arrays compare equal to tuples, True to 1
+    if isinstance(one, (list, tuple)) and isinstance(two, (list, tuple)):
+        return len(one) == len(two) and all(map(_same, one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_same(one[k], two[k]) for k in one)
+    return one == two
+
+
+def _unique(items):
+    seen = set()
+    add = seen.add
+    try:
+        for item in items:
+            if item in seen:
+                return False
+            add(item)
+    except TypeError:
+        # unhashable items, e.g. nested objects or arrays
+        items = list(items)
+        return not any(_same(a, b) for i, a in enumerate(items) for b in items[i + 1 :])
+    return True
+
+
+def _enum_member(value, members):
+    try:
+        return (value.__class__, value) in members
+    except TypeError:
+        return False
+
+
+def _is_date(instance):
+    if isinstance(instance, datetime.datetime):
+        return False
+    if not isinstance(instance, str):
+        return True
+    if DATE_RE.match(instance) is None:
+        return False
+    try:
+        datetime.date.fromisoformat(instance)
+    except ValueError:
+        return False
+    return True
+
+
+# Precompiled checks used instead of the format checker's generic dispatch.
+FORMAT_CHECKS = {"date": _is_date}
+
+
+def _is_date_value(instance):
+    # a datetime would be dumped with its time of day, which is no date
+    if isinstance(instance, datetime.datetime):
+        return False
+    return draft7_format_checker.conforms(instance, "date")
+
+
+# draft7_format_checker, except that "date" also rejects datetime objects.
+# Strings are still checked by jsonschema, _is_date is only the fast path
+# and may reject more, e.g. "2020-1-05".
+FORMAT_CHECKER = FormatChecker(draft7_format_checker.checkers)
+FORMAT_CHECKER.checks("date")(_is_date_value)
+
+
+class SchemaCompiler:
+    """
+    Generate a python function `check(instance) -> bool` out of a json schema.
+
+    The generated check never accepts an instance jsonschema would reject,
+    but it may reject one jsonschema accepts (e.g. decimals or integral
+    floats against enums), callers are expected to fall back to jsonschema
+    whenever it returns False in order to report errors.
+    """
+
+    def __init__(self, check_formats=False):
+        self.check_formats = check_formats
+        self.namespace = {
+            "_MISSING": _MISSING,
+            "_Number": numbers.Number,
+            "_always": _always,
+            "_never": _never,
+            "_enum_member": _enum_member,
+            "_equal": _equal,
+            "_unique": _unique,
+            "_conforms": FORMAT_CHECKER.conforms,
+        }
+        self.source = []
+        self._counter = itertools.count()
+
+    def compile(self, schema):
+        name = self._compile(schema)
+        code = compile("\n".join(self.source), "<jsonene-compiled>", "exec")
+        exec(code, self.namespace)
+        return self.namespace[name]
+
+    def _name(self, prefix):
+        return f"{prefix}{next(self._counter)}"
+
+    def _constant(self, value):
+        name = self._name("_k")
+        self.namespace[name] = value
+        return name
+
+    def _is_valid(self, schema):
+        # exact jsonschema answer, required wherever a result gets negated
+        format_checker = FORMAT_CHECKER if self.check_formats else None
+        validator = Draft7Validator(schema, format_checker=format_checker)
+        return self._constant(validator.is_valid)
+
+    def _compile(self, schema):
+        if schema is True:
+            return "_always"
+        if schema is False:
+            return "_never"
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(schema)
+        if UNSUPPORTED_KEYWORDS.intersection(schema):
+            raise UnsupportedSchema(schema)
+
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+        groups = {}
+        ordered = sorted(
+            schema.items(),
+            key=lambda item: _KEYWORD_ORDER.get(item[0], len(CHEAP_KEYWORDS)),
+        )
+        for keyword, value in ordered:
+            if keyword in ANNOTATION_KEYWORDS:
+                continue
+            handler = getattr(self, "_emit_" + keyword, None)
+            if handler is None:
+                # jsonschema ignores unknown keywords as well
+                continue
+            group, lines = handler(value, schema)
+            groups.setdefault(group, []).extend(lines)
+
+        name = self._name("_check")
+        body = []
+        for group, lines in groups.items():
+            body.extend(self._guard(group, lines, types))
+        self.source.append(f"def {name}(v):")
+        self.source.extend("    " + line for line in body)
+        self.source.extend(["    return True", ""])
+        return name
+
+    def _guard(self, group, lines, types):
+        if group is None or not lines:
+            return lines
+        allowed = _GROUP_TYPES[group]
+        if types is not None and set(types) <= allowed:
+            return lines
+        guarded = []
+        if group == "number":
+            guarded.append(
+                "if v.__class__ is not bool and isinstance(v, _Number)"
+                " and not isinstance(v, (int, float)):"
+            )
+            guarded.append("    return False")
+        guarded.append(f"if {TYPE_CHECKS[group].format(v='v')}:")
+        guarded.extend("    " + line for line in lines)
+        return guarded
+
+    def _valid_expr(self, schema, var):
+        # Expression true when `var` is valid. Plain typed schemas, e.g. the
+        # positions of List(Integer, String, String), are fused inline
+        # instead of calling a generated function per item.
+        if schema is True:
+            return "True"
+        if isinstance(schema, dict):
+            types = schema.get("type")
+            group = _TYPE_GROUPS.get(types) if isinstance(types, str) else None
+            keywords = set(schema) - ANNOTATION_KEYWORDS - {"type"}
+            if group is not None and all(
+                INLINE_KEYWORDS.get(k, (None,))[0] == group for k in keywords
+            ):
+                parts = [TYPE_CHECKS[types].format(v=var)]
+                for keyword in keywords:
+                    template = INLINE_KEYWORDS[keyword][1]
+                    parts.append(
+                        template.format(v=var, k=self._constant(schema[keyword]))
+                    )
+                return "(" + " and ".join(parts) + ")"
+        return f"{self._compile(schema)}({var})"
+
+    # generic
+
+    def _emit_type(self, value, schema):
+        types = [value] if isinstance(value, str) else value
+        try:
+            checks = [TYPE_CHECKS[t].format(v="v") for t in types]
+        except (KeyError, TypeError):
+            raise UnsupportedSchema(schema)
+        return None, [f"if not ({' or '.join(checks)}):", "    return False"]
+
+    def _emit_const(self, value, schema):
+        if value is None or isinstance(value, bool):
+            return None, [f"if v is not {value!r}:", "    return False"]
+        const = self._constant(value)
+        if isinstance(value, str):
+            return None, [f"if v != {const}:", "    return False"]
+        if isinstance(value, (int, float)):
+            return None, [
+                f"if v.__class__ is bool or v != {const}:",
+                "    return False",
+            ]
+        return None, [f"if not _equal(v, {const}):", "    return False"]
+
+    def _emit_enum(self, value, schema):
+        if value and all(isinstance(e, str) for e in value):
+            members = self._constant(frozenset(map(sys.intern, value)))
+            return None, [
+                f"if not (isinstance(v, str) and v in {members}):",
+                "    return False",
+            ]
+        try:
+            members = self._constant(frozenset((e.__class__, e) for e in value))
+        except TypeError:
+            return None, [
+                f"if not {self._is_valid({'enum': value})}(v):",
+                "    return False",
+            ]
+        return None, [f"if not _enum_member(v, {members}):", "    return False"]
+
+    def _emit_format(self, value, schema):
+        if not self.check_formats or value not in FORMAT_CHECKER.checkers:
+            return None, []
+        if value in FORMAT_CHECKS:
+            check = self._constant(FORMAT_CHECKS[value])
+            return None, [f"if not {check}(v):", "    return False"]
+        fmt = self._constant(value)
+        return None, [f"if not _conforms(v, {fmt}):", "    return False"]
+
+    def _emit_allOf(self, value, schema):
+        checks = [f"{self._compile(s)}(v)" for s in value]
+        return None, [f"if not ({' and '.join(checks)}):", "    return False"]
+
+    def _emit_anyOf(self, value, schema):
+        checks = [f"{self._compile(s)}(v)" for s in value]
+        return None, [f"if not ({' or '.join(checks)}):", "    return False"]
+
+    def _emit_oneOf(self, value, schema):
+        checks = ", ".join(self._is_valid(s) for s in value)
+        return None, [
+            f"if sum(1 for c in ({checks},) if c(v)) != 1:",
+            "    return False",
+        ]
+
+    def _emit_not(self, value, schema):
+        return None, [f"if {self._is_valid(value)}(v):", "    return False"]
+
+    # string
+
+    def _emit_minLength(self, value, schema):
+        return "string", [f"if len(v) < {value!r}:", "    return False"]
+
+    def _emit_maxLength(self, value, schema):
+        return "string", [f"if len(v) > {value!r}:", "    return False"]
+
+    def _emit_pattern(self, value, schema):
+        pattern = self._constant(re.compile(value))
+        return "string", [f"if not {pattern}.search(v):", "    return False"]
+
+    # number
+
+    def _emit_minimum(self, value, schema):
+        return "number", [f"if v < {self._constant(value)}:", "    return False"]
+
+    def _emit_maximum(self, value, schema):
+        return "number", [f"if v > {self._constant(value)}:", "    return False"]
+
+    def _emit_exclusiveMinimum(self, value, schema):
+        return "number", [f"if v <= {self._constant(value)}:", "    return False"]
+
+    def _emit_exclusiveMaximum(self, value, schema):
+        return "number", [f"if v >= {self._constant(value)}:", "    return False"]
+
+    def _emit_multipleOf(self, value, schema):
+        db = self._constant(value)
+        if isinstance(value, float):
+            return "number", [f"if int(v / {db}) != v / {db}:", "    return False"]
+        return "number", [f"if v % {db}:", "    return False"]
+
+    # array
+
+    def _emit_minItems(self, value, schema):
+        return "array", [f"if len(v) < {value!r}:", "    return False"]
+
+    def _emit_maxItems(self, value, schema):
+        return "array", [f"if len(v) > {value!r}:", "    return False"]
+
+    def _emit_uniqueItems(self, value, schema):
+        if not value:
+            return "array", []
+        return "array", ["if not _unique(v):", "    return False"]
+
+    def _emit_items(self, value, schema):
+        if isinstance(value, list):
+            lines = ["n = len(v)"]
+            for index, item_schema in enumerate(value):
+                valid = self._valid_expr(item_schema, "x")
+                lines.append(f"if n > {index}:")
+                lines.append(f"    x = v[{index}]")
+                lines.append(f"    if not {valid}:")
+                lines.append("        return False")
+            return "array", lines
+        valid = self._valid_expr(value, "x")
+        return "array", [
+            "for x in v:",
+            f"    if not {valid}:",
+            "        return False",
+        ]
+
+    def _emit_additionalItems(self, value, schema):
+        items = schema.get("items", {})
+        if isinstance(items, dict):
+            return "array", []
+        if not isinstance(items, list):
+            raise UnsupportedSchema(schema)
+        if isinstance(value, dict):
+            valid = self._valid_expr(value, "x")
+            return "array", [
+                f"for x in v[{len(items)}:]:",
+                f"    if not {valid}:",
+                "        return False",
+            ]
+        if value:
+            return "array", []
+        return "array", [f"if len(v) > {len(items)}:", "    return False"]
+
+    def _emit_contains(self, value, schema):
+        valid = self._valid_expr(value, "x")
+        return "array", [f"if not any({valid} for x in v):", "    return False"]
+
+    # object
+
+    def _emit_minProperties(self, value, schema):
+        return "object", [f"if len(v) < {value!r}:", "    return False"]
+
+    def _emit_maxProperties(self, value, schema):
+        return "object", [f"if len(v) > {value!r}:", "    return False"]
+
+    def _emit_required(self, value, schema):
+        if not value:
+            return "object", []
+        if len(value) == 1:
+            return "object", [
+                f"if {self._constant(value[0])} not in v:",
+                "    return False",
+            ]
+        # one C level subset test instead of a lookup per name
+        required = self._constant(frozenset(value))
+        return "object", [f"if not v.keys() >= {required}:", "    return False"]
+
+    def _emit_properties(self, value, schema):
+        lines = []
+        for name, property_schema in value.items():
+            if property_schema is True:
+                continue
+            key = self._constant(name)
+            valid = self._valid_expr(property_schema, "x")
+            lines.append(f"x = v.get({key}, _MISSING)")
+            lines.append(f"if x is not _MISSING and not {valid}:")
+            lines.append("    return False")
+        return "object", lines
+
+    def _emit_additionalProperties(self, value, schema):
+        if value is True:
+            return "object", []
+        known = self._constant(frozenset(schema.get("properties", {})))
+        if isinstance(value, dict):
+            valid = self._valid_expr(value, "x")
+            return "object", [
+                "for k, x in v.items():",
+                f"    if k not in {known} and not {valid}:",
+                "        return False",
+            ]
+        if value:
+            return "object", []
+        return "object", [f"if not {known}.issuperset(v):", "    return False"]
+
+    def _emit_dependencies(self, value, schema):
+        lines = []
+        for name, dependency in value.items():
+            key = self._constant(name)
+            if isinstance(dependency, list):
+                if not dependency:
+                    continue
+                missing = " or ".join(
+                    f"{self._constant(target)} not in v" for target in dependency
+                )
+                lines.append(f"if {key} in v and ({missing}):")
+            else:
+                lines.append(f"if {key} in v and not {self._compile(dependency)}(v):")
+            lines.append("    return False")
+        return "object", lines
+
+
+_TYPE_GROUPS = {
+    "string": "string",
+    "integer": "number",
+    "number": "number",
+    "boolean": "boolean",
+    "null": "null",
+    "array": "array",
+    "object": "object",
+}
+
+_GROUP_TYPES = {
+    "string": {"string"},
+    "number": {"integer", "number"},
+    "array": {"array"},
+    "object": {"object"},
+}
+
+
+def _fastjsonschema_check(schema, check_formats=False):
+    validate = fastjsonschema.compile(
+        schema, use_default=False, use_formats=check_formats
+    )
+    invalid = fastjsonschema.JsonSchemaValueException
+
+    def check(instance):
+        try:
+            validate(instance)
+        except invalid:
+            return False
+        return True
+
+    return check
+
+
+def _jsonschema_rs_check(schema, check_formats=False):
+    is_valid = jsonschema_rs.Draft7Validator(
+        schema, validate_formats=check_formats
+    ).is_valid
+
+    def check(instance):
+        try:
+            return is_valid(instance)
+        except ValueError:
+            # values it cannot convert, such as dates, are left to jsonschema
+            return False
+
+    return check
+
+
+def compile_schema(schema, check_formats=False, backend=None):
+    backend = backend or BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    if backend == "jsonschema":
+        return None
+    if backend == "jsonschema-rs":
+        if jsonschema_rs is None:
+            raise ImportError("The jsonschema-rs backend needs jsonschema_rs")
+        return _jsonschema_rs_check(schema, check_formats)
+    if backend == "jsonene":
+        try:
+            return SchemaCompiler(check_formats).compile(schema)
+        except UnsupportedSchema:
+            return None
+    if fastjsonschema is None:
+        raise ImportError("The fastjsonschema backend needs fastjsonschema")
+    try:
+        return _fastjsonschema_check(schema, check_formats)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
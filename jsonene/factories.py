@@ -1,5 +1,5 @@
 from factory import BaseDictFactory, BaseListFactory
-from .fields import SchemaType, List
+from .fields import ObjectType, List
 
 
 class SchemaFactory(BaseDictFactory):
@@ -8,9 +8,8 @@ class SchemaFactory(BaseDictFactory):
 
     @classmethod
     def _build(cls, model_schema, *args, **kwargs):
-        if args:
-            assert False, "Not allowed"
-        assert issubclass(model_schema, SchemaType)
+        assert not args, "Not allowed"
+        assert issubclass(model_schema, ObjectType)
         return model_schema(**kwargs)
 
     @classmethod
@@ -24,11 +23,10 @@ class ListSchemaFactory(BaseListFactory):
 
     @classmethod
     def _build(cls, model_schema, *args, **kwargs):
-        if args:
-            assert False, "Not allowed"
+        assert not args, "Not allowed"
         assert issubclass(model_schema, List)
-        values = kwargs.values()
-        return model_schema([*values])
+        # a List is a field, the instances it validates are plain lists
+        return list(kwargs.values())
 
     @classmethod
     def _create(cls, model_schema, *args, **kwargs):
@@ -1,15 +1,142 @@
-import jsonschema
 import abc
 import json
 import inspect
 import enum
-from collections.abc import Iterable
-from cached_property import cached_property
-from functools import partial
-from jsonschema.validators import validator_for
-from jsonschema import draft7_format_checker
+import datetime
+import decimal
+import re
+import sys
+import uuid
+import weakref
+from functools import lru_cache, partial
 from itertools import cycle
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# dates and the like are kept as objects on instances and only converted when
+# dumped, the exact type is looked up first and subclasses fall back to the
+# isinstance walk below
+_JSON_COERCE = {
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: datetime.time.isoformat,
+    uuid.UUID: str,
+    decimal.Decimal: str,
+}
+
+
+def _json_default(value):
+    coerce = _JSON_COERCE.get(value.__class__)
+    if coerce is not None:
+        return coerce(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(
+        f"Object of type {value.__class__.__name__} is not JSON serializable"
+    )
+
+
+def _dumps(value, indent=None):
+    # orjson only knows how to indent by two spaces
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            return orjson.dumps(value, default=_json_default, option=option).decode()
+        except orjson.JSONEncodeError:
+            # orjson is stricter, e.g. integers past 64 bits or non-str keys
+            pass
+    return json.dumps(value, indent=indent, default=_json_default)
+
+
+def _loads(data):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter, e.g. NaN or integers past 64 bits
+            pass
+    return json.loads(data)
+
+
+# jsonschema and the compiler (which needs jsonschema) are imported on first
+# validation, declaring and exporting schemas does not load them.
+def compile_schema(schema, check_formats=False):
+    from .compiler import compile_schema
+
+    return compile_schema(schema, check_formats=check_formats)
+
+
+_MISSING = object()
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+# Fields declaring the same schema share their compiled checks/validators.
+_SHARED_CACHE_SIZE = 1024
+_shared_checks = {}
+_shared_validators = {}
+
+
+def _shared(cache, schema, options, build):
+    # repr() keeps apart what json.dumps would merge, such as tuples and
+    # lists, True and 1, or the same keys in another order
+    key = (repr(schema),) + options
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    if len(cache) >= _SHARED_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    value = cache[key] = build()
+    return value
+
+
+def _uses_formats(schema):
+    if isinstance(schema, dict):
+        return "format" in schema or any(map(_uses_formats, schema.values()))
+    if isinstance(schema, list):
+        return any(map(_uses_formats, schema))
+    return False
+
+
+_compile_pattern = lru_cache(maxsize=1024)(re.compile)
+
+
+@lru_cache(maxsize=None)
+def _draft7_validator():
+    # Draft7Validator whose `pattern` reuses compiled patterns rather than
+    # going through re.search and the re module cache for every string
+    from jsonschema.exceptions import ValidationError
+    from jsonschema.validators import Draft7Validator, extend
+
+    def pattern(validator, patrn, instance, schema):
+        if not validator.is_type(instance, "string"):
+            return
+        if not _compile_pattern(patrn).search(instance):
+            yield ValidationError("%r does not match %r" % (instance, patrn))
+
+    return extend(Draft7Validator, {"pattern": pattern})
+
+
+def _build_validator(schema, draft_cls=None, check_formats=False):
+    from .compiler import FORMAT_CHECKER
+
+    # schemas are built by the fields themselves, always as Draft 7 and with
+    # no $schema to look up, so skip the metaschema check as well
+    draft_cls = draft_cls or _draft7_validator()
+    # without a format keyword the checker would only cost a call per value
+    if check_formats and _uses_formats(schema):
+        format_checker = FORMAT_CHECKER
+    else:
+        format_checker = None
+    return draft_cls(schema, format_checker=format_checker)
+
 
 # base class for all fields
 class BaseObjectType:
@@ -19,11 +146,47 @@ class BaseObjectType:
 
     Field = asField
 
-    def validate(self, **kwargs):
-        return self.asField().validate_instance(self, **kwargs)
+    @classmethod
+    def _default_field(cls):
+        # `asField()` builds a new field on each call, ObjectTypeMeta keeps
+        # one per class so its schema and compiled checks are built once. It
+        # is kept on the class own _meta, out of sight of the field scan.
+        return cls._meta.default_field
+
+    @classmethod
+    def json_schema(cls):
+        return cls._default_field().json_schema
 
-    def validation_errors(self):
-        return list(self.asField().validation_errors(self))
+    @classmethod
+    def __compile__(cls, check_formats=False):
+        return cls._default_field()._compiled_check(check_formats)
+
+    @classmethod
+    def compile(cls, check_formats=False):
+        return cls._default_field().compile(check_formats)
+
+    def validate(self, draft_cls=None, check_formats=False):
+        if draft_cls is None:
+            check = self.__compile__(check_formats)
+            if check is not None and check(self):
+                return None
+        return self._default_field()._validate_instance(
+            self, draft_cls=draft_cls, check_formats=check_formats
+        )
+
+    def _iter_validation_errors(self, check_formats=False):
+        check = self.__compile__(check_formats)
+        if check is not None and check(self):
+            return iter(())
+        return self._default_field().validation_errors(
+            self, check_formats=check_formats
+        )
+
+    def validation_errors(self, check_formats=False):
+        return list(self._iter_validation_errors(check_formats))
+
+    def validation_messages(self, check_formats=False):
+        return [error.message for error in self._iter_validation_errors(check_formats)]
 
     def __repr__(self):
         return f"{self.__class__}/{super().__repr__()}"
@@ -33,26 +196,25 @@ class BaseObjectType:
 
     @classmethod
     def _get_all_supers(cls):
-        return [cls for cls in cls.__mro__ if cls.__name__ != "object"]
+        # `object` always closes the mro
+        return cls.__mro__[:-1]
 
     @classmethod
     def _get_allowed_fields_values(cls):
-        visited = set()
-        for sup in cls._get_all_supers():
-            for attr_name, field_obj in sup.__dict__.items():
-                if (
-                    isinstance(field_obj, BaseSchemaField.Schema)
-                    and attr_name not in visited
-                ):
-                    yield attr_name, field_obj
-                    visited.add(attr_name)
+        # resolved once by ObjectTypeMeta when the class is created
+        return cls._meta.allowed_fields_map.items()
 
     @classmethod
     def _confirm_json_loaded(cls, data):
-        raise NotImplementedError()
+        if isinstance(data, (str, bytes, bytearray)):
+            return _loads(data)
+        return data
 
     @classmethod
     def is_json_serializale(cls, value):
+        # scalars always dump, only containers need the json.dumps probe
+        if value.__class__ in _JSON_SCALARS:
+            return True
         try:
             json.dumps(value)
         except TypeError:
@@ -60,11 +222,27 @@ class BaseObjectType:
         return True
 
     def to_json(self, indent=2):
-        return json.dumps(self.serialize_json(), indent=indent)
+        return _dumps(self, indent=indent)
 
 
 class BaseSchemaField:
+    __slots__ = (
+        "required",
+        "name",
+        "description",
+        "title",
+        "use_default",
+        "null",
+        "_json_schema",
+        "_compiled_checks",
+        "_validators",
+        "_owners",
+        "__weakref__",
+    )
     JSON_SCHEMA_TYPE = "object"
+    # groups of (attribute, keyword) pairs, the first attribute set in a
+    # group goes into the schema
+    SCHEMA_KEYWORDS = ()
 
     def __init__(
         self,
@@ -75,6 +253,10 @@ class BaseSchemaField:
         use_default=None,
         null=False,
     ):
+        self._json_schema = None
+        self._compiled_checks = {}
+        self._validators = {}
+        self._owners = None
         self.required = required
         self.name = name
         self.description = description
@@ -82,47 +264,129 @@ class BaseSchemaField:
         self.use_default = self._validate_use_default(use_default)
         self.null = null
 
+    def __setattr__(self, name, value):
+        # assigning a schema attribute once the schema is built, or once the
+        # field is part of a class, drops what was derived from it
+        object.__setattr__(self, name, value)
+        if name[0] != "_" and (
+            getattr(self, "_json_schema", None) is not None
+            or getattr(self, "_owners", None)
+        ):
+            self._invalidate()
+
+    def _invalidate(self):
+        self._json_schema = None
+        self._compiled_checks = {}
+        self._validators = {}
+        # fields whose schema embeds this one are stale as well
+        owners, self._owners = self._owners, None
+        for owner in owners or ():
+            owner._invalidate()
+
+    def _add_owner(self, owner):
+        if self._owners is None:
+            self._owners = weakref.WeakSet()
+        self._owners.add(owner)
+
+    def _embed(self, field):
+        # the schema of `field`, as part of this field's schema
+        field._add_owner(self)
+        return field.json_schema
+
     def to_json_schema(self):
-        if self.null:
-            schema = {"type": [self.JSON_SCHEMA_TYPE, "null"]}
-        else:
-            schema = {"type": self.JSON_SCHEMA_TYPE}
+        _type = self.JSON_SCHEMA_TYPE
+        schema = {"type": [_type, "null"] if self.null else _type}
         if self.title is not None:
             schema["title"] = self.title
         if self.description is not None:
             schema["description"] = self.description
+        for group in self.SCHEMA_KEYWORDS:
+            for attr, keyword in group:
+                value = getattr(self, attr)
+                if value is not None:
+                    schema[keyword] = value
+                    break
         return schema
 
-    @cached_property
+    @property
     def json_schema(self):
-        return self.to_json_schema()
+        schema = self._json_schema
+        if schema is None:
+            schema = self._json_schema = self.to_json_schema()
+        return schema
+
+    def _compiled_check(self, check_formats=False):
+        if check_formats not in self._compiled_checks:
+            schema = self.json_schema
+            self._compiled_checks[check_formats] = _shared(
+                _shared_checks,
+                schema,
+                (check_formats,),
+                partial(compile_schema, schema, check_formats=check_formats),
+            )
+        return self._compiled_checks[check_formats]
+
+    def compile(self, check_formats=False):
+        # a validate function bound to this schema, raising like
+        # `validate_instance` but without its per call lookups
+        check = self._compiled_check(check_formats)
+        validate_instance = partial(
+            self._validate_instance, check_formats=check_formats
+        )
+        if check is None:
+            return validate_instance
+
+        def validate(instance):
+            if not check(instance):
+                validate_instance(instance)
+
+        return validate
 
     def validate_instance(self, instance, draft_cls=None, check_formats=False):
-        schema = self.json_schema
         if isinstance(instance, BaseSchemaField):
             instance = instance.serialize()
-        if check_formats:
-            # TODO warning depedencied
-            # https://python-jsonschema.readthedocs.io/en/stable/validate/
-            return jsonschema.validate(
-                instance=instance,
-                schema=schema,
-                cls=draft_cls,
-                format_checker=jsonschema.draft7_format_checker,
+        if draft_cls is None:
+            check = self._compiled_check(check_formats)
+            if check is not None and check(instance):
+                return None
+        return self._validate_instance(instance, draft_cls, check_formats)
+
+    def _validator(self, draft_cls=None, check_formats=False):
+        key = (draft_cls, check_formats)
+        validator = self._validators.get(key)
+        if validator is None:
+            schema = self.json_schema
+            validator = self._validators[key] = _shared(
+                _shared_validators,
+                schema,
+                key,
+                partial(_build_validator, schema, draft_cls, check_formats),
             )
-        return jsonschema.validate(instance=instance, schema=schema, cls=draft_cls)
+        return validator
+
+    def _validate_instance(self, instance, draft_cls=None, check_formats=False):
+        from jsonschema.exceptions import best_match
+
+        # same error selection as jsonschema.validate
+        validator = self._validator(draft_cls, check_formats)
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
 
     def validation_errors(self, instance, draft_cls=None, check_formats=False):
-        schema = self.json_schema
         if isinstance(instance, BaseSchemaField):
             instance = instance.serialize()
-        if not draft_cls:
-            draft_cls = jsonschema.validators.validator_for(schema)
-        if check_formats:
-            return draft_cls(schema).iter_errors(instance)
-        return draft_cls(
-            schema, format_checker=jsonschema.draft7_format_checker
-        ).iter_errors(instance)
+        return self._validator(draft_cls, check_formats).iter_errors(instance)
+
+    def iter_errors_batch(self, instances, check_formats=False):
+        # the check and validator are looked up once for all instances
+        check = self._compiled_check(check_formats)
+        iter_errors = self._validator(None, check_formats).iter_errors
+        for instance in instances:
+            if check is not None and check(instance):
+                yield []
+            else:
+                yield list(iter_errors(instance))
 
     @classmethod
     def _validate_use_default(cls, value):
@@ -132,11 +396,17 @@ class BaseSchemaField:
 
 
 class PrimitiveBaseSchemaField(BaseSchemaField):
-    pass
+    __slots__ = ()
 
 
 class Number(PrimitiveBaseSchemaField):
+    __slots__ = ("min", "max", "exclusive_min", "exclusive_max", "multiple_of")
     JSON_SCHEMA_TYPE = "number"
+    SCHEMA_KEYWORDS = (
+        (("min", "minimum"), ("exclusive_min", "exclusiveMinimum")),
+        (("max", "maximum"), ("exclusive_max", "exclusiveMaximum")),
+        (("multiple_of", "multipleOf"),),
+    )
 
     def __init__(
         self,
@@ -149,6 +419,9 @@ class Number(PrimitiveBaseSchemaField):
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        if __debug__:
+            for value in (min, exclusive_min, max, exclusive_max):
+                assert value is None or value >= 0
 
         self.min = min
         self.max = max
@@ -156,92 +429,90 @@ class Number(PrimitiveBaseSchemaField):
         self.exclusive_max = exclusive_max
         self.multiple_of = multiple_of
 
-    def to_json_schema(self):
-        schema = super().to_json_schema()
-        if self.min is not None:
-            assert self.min >= 0
-            schema["minimum"] = self.min
-        elif self.exclusive_min is not None:
-            assert self.exclusive_min >= 0
-            schema["exclusiveMinimum"] = self.exclusive_min
-        if self.max is not None:
-            assert self.max >= 0
-            schema["maximun"] = self.max
-        elif self.exclusive_max is not None:
-            assert self.exclusive_max >= 0
-            schema["exclusiveMaximun"] = self.exclusive_max
-        if self.multiple_of is not None:
-            schema["multipleOf"] = self.multiple_of
-        return schema
-
 
 class Integer(Number):
+    __slots__ = ()
     JSON_SCHEMA_TYPE = "integer"
 
 
 class String(PrimitiveBaseSchemaField):
+    __slots__ = ("min_len", "max_len", "_pattern", "blank")
     JSON_SCHEMA_TYPE = "string"
+    SCHEMA_KEYWORDS = (
+        (("_min_length", "minLength"),),
+        (("max_len", "maxLength"),),
+        (("pattern", "pattern"),),
+    )
 
     def __init__(
         self, *args, min_len=None, max_len=None, pattern=None, blank=False, **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        if __debug__:
+            for value in (min_len, max_len):
+                assert value is None or value >= 0
         self.min_len = min_len
         self.max_len = max_len
         self.pattern = pattern
         self.blank = blank
 
-    def to_json_schema(self):
-        schema = super().to_json_schema()
+    @property
+    def pattern(self):
+        return self._pattern
+
+    @pattern.setter
+    def pattern(self, pattern):
+        # a bad pattern fails where the field is declared, the compiled
+        # pattern is kept for the validator's `pattern` check
+        if pattern is not None:
+            _compile_pattern(pattern)
+        self._pattern = pattern
+
+    @property
+    def _min_length(self):
+        if self.blank is False and not self.min_len:
+            return 1
         if self.min_len is not None:
-            assert self.min_len >= 0
-            schema["minLength"] = self.min_len
-        elif self.blank is True:
-            schema["minLength"] = 0
-        if self.max_len is not None:
-            assert self.max_len >= 0
-            schema["maxLength"] = self.max_len
-        if self.pattern is not None:
-            schema["pattern"] = pattern
-        if self.blank is False:
-            if not self.min_len:
-                schema["minLength"] = 1
-        return schema
+            return self.min_len
+        return 0 if self.blank is True else None
 
 
 class Boolean(PrimitiveBaseSchemaField):
+    __slots__ = ()
     JSON_SCHEMA_TYPE = "boolean"
 
 
 class Null(PrimitiveBaseSchemaField):
+    __slots__ = ()
     JSON_SCHEMA_TYPE = "null"
 
 
 class BaseSchemaFieldMatchParam(BaseSchemaField):
+    __slots__ = ("match_value",)
+
     def __init__(self, match_value, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.match_value = match_value
 
     def to_json_schema(self):
-        value = (
-            self.match_value.serialize()
-            if isinstance(self.match_value, BaseSchemaField)
-            else self.match_value
-        )
-        return {self.JSON_SCHEMA_TYPE: value}
+        # match values are stored ready for the schema, ObjectType instances
+        # included as they are dicts already
+        return {self.JSON_SCHEMA_TYPE: self.match_value}
 
 
 class Const(BaseSchemaFieldMatchParam):
+    __slots__ = ()
     JSON_SCHEMA_TYPE = "const"
 
 
 class Enum(BaseSchemaFieldMatchParam):
+    __slots__ = ()
     JSON_SCHEMA_TYPE = "enum"
 
     def __init__(
         self, match_value, *args, **kwargs,
     ):
-        assert isinstance(match_value, Iterable)
+        # list() raises TypeError for anything not iterable
         if isinstance(match_value, enum.EnumMeta):
             match_value = [e.value for e in match_value]
         else:
@@ -252,6 +523,8 @@ class Enum(BaseSchemaFieldMatchParam):
 
 
 class Format(BaseSchemaFieldMatchParam):
+    __slots__ = ()
+    JSON_SCHEMA_TYPE = "format"
     IDN_EMAIL = "idn-email"
     EMAIL = "email"
     DATE = "date"
@@ -268,12 +541,21 @@ class Format(BaseSchemaFieldMatchParam):
     URI_TEMPLATE = "uri-template"
     REGEX = "regex"
 
-    def to_json_schema(self):
-        return {"format": self.match_value}
-
 
 class List(BaseSchemaField):
+    __slots__ = (
+        "types",
+        "datatypes",
+        "max_items",
+        "min_items",
+        "unique_items",
+        "max_contains",
+        "min_contains",
+        "contains",
+        "additional_items",
+    )
     JSON_SCHEMA_TYPE = "array"
+    SCHEMA_KEYWORDS = ((("max_items", "maxItems"),), (("min_items", "minItems"),))
 
     def __init__(
         self,
@@ -291,13 +573,13 @@ class List(BaseSchemaField):
         _types = []
         _datatypes = []
         for _type in types:
-            if isinstance(_type, List):
-                _type = _type
-            elif issubclass(_type, SchemaObjectType):
+            if isinstance(_type, BaseSchemaField):
+                pass
+            elif issubclass(_type, ObjectType):
                 _type = _type.asField()
             else:
                 _type = _type()
-            assert isinstance(_type, BaseSchemaField) is True
+                assert isinstance(_type, BaseSchemaField)
             _types.append(_type)
 
         if len(_types):
@@ -315,22 +597,27 @@ class List(BaseSchemaField):
         self.contains = contains
         self.additional_items = additional_items
 
+    @staticmethod
+    def _item_deserializer(_type):
+        if isinstance(_type, ObjectType.Schema):
+            return _type.field_class.deserialize
+        if isinstance(_type, List):
+            return _type.deserialize
+        return None
+
     def deserialize(self, data):
-        obj = list()
-        if isinstance(self.types, list):
-            types = cycle(self.types)
-        else:
-            types = cycle([self.types])
-        for item, _type in zip(data, types):
-            v = item
-            if isinstance(_type, SchemaObjectType.Schema):
-                v = _type.field_class.deserialize(v)
-            elif isinstance(_type, List):
-                v = _type.deserialize(v)
-            else:
-                v = v
-            obj.append(v)
-        return obj
+        _types = self.types if isinstance(self.types, list) else [self.types]
+        # resolved once per call instead of per item
+        converters = [self._item_deserializer(_type) for _type in _types]
+        if converters and not any(converters):
+            # no item needs converting, e.g. List(Integer)
+            return list(data)
+        if len(converters) == 1:
+            return list(map(converters[0], data))
+        return [
+            item if convert is None else convert(item)
+            for item, convert in zip(data, cycle(converters))
+        ]
 
     def to_json_schema(self):
         schema = super().to_json_schema()
@@ -338,14 +625,9 @@ class List(BaseSchemaField):
             if self.types:
                 schema["items"] = []
                 for _type in self.types:
-                    schema["items"].append(_type.to_json_schema())
+                    schema["items"].append(self._embed(_type))
         else:
-            schema["items"] = self.types.to_json_schema()
-
-        if self.max_items is not None:
-            schema["maxItems"] = self.max_items
-        if self.min_items is not None:
-            schema["minItems"] = self.min_items
+            schema["items"] = self._embed(self.types)
 
         schema["uniqueItems"] = self.unique_items
 
@@ -353,7 +635,7 @@ class List(BaseSchemaField):
             schema["additionalItems"] = self.additional_items
 
         if self.contains is not None:
-            schema["contains"] = self.contains.to_json_schema()
+            schema["contains"] = self._embed(self.contains)
         if self.min_contains is not None:
             schema["minContains"] = self.min_contains.to_json_schema()
         if self.max_contains is not None:
@@ -361,16 +643,83 @@ class List(BaseSchemaField):
         return schema
 
 
+def _dependency_pairs(field_dependencies):
+    # (source, targets) pairs, resolved once instead of on every schema build
+    return tuple((d.source, tuple(d.targets)) for d in field_dependencies or ())
+
+
+def _build_deserializer(kclass):
+    # Straight-line code for one ObjectType class, one block per field:
+    #   v = data.get("age", _MISSING)
+    #   if v is not _MISSING:
+    #       obj["age"] = v
+    # fields with a default read `data.get("age", _d0)` instead, nested
+    # schemas and lists pass the value through their own deserialize.
+    namespace = {"_MISSING": _MISSING}
+    lines = [
+        "def deserialize(cls, data):",
+        "    obj = cls()",
+    ]
+    for i, (key, field_obj, default) in enumerate(kclass._meta.bound_fields):
+        key = repr(key)
+        namespace[f"_f{i}"] = field_obj
+        namespace[f"_d{i}"] = default
+        if isinstance(field_obj, ObjectType.Schema):
+            convert = f"_f{i}.field_class.deserialize"
+        elif isinstance(field_obj, List):
+            convert = f"_f{i}.deserialize"
+        else:
+            convert = ""
+        if default is not None:
+            lines.append(f"    obj[{key}] = {convert}(data.get({key}, _d{i}))")
+        else:
+            lines.append(f"    v = data.get({key}, _MISSING)")
+            lines.append("    if v is not _MISSING:")
+            lines.append(f"        obj[{key}] = {convert}(v)")
+    lines.append("    return obj")
+    code = compile("\n".join(lines), f"<jsonene-deserialize {kclass.__name__}>", "exec")
+    exec(code, namespace)
+    return namespace["deserialize"]
+
+
+META_DEFAULTS = (
+    ("field_dependencies", None),
+    ("additional_properties", False),
+)
+
+
 class ObjectTypeMeta(type):
     def __new__(cls, name, bases, dct):
         kclass = super().__new__(cls, name, bases, dct)
-        kclass._meta = kclass.Meta()
+        kclass._meta = _meta = kclass.Meta()
+        # Meta classes need not extend ObjectType.Meta, resolve the options
+        # once so the rest of the code reads plain attributes
+        for option, default in META_DEFAULTS:
+            setattr(_meta, option, getattr(_meta, option, default))
         kclass._meta.allowed_fields_map = dict(cls._get_allowed_fields_values(kclass))
+        kclass._meta.dependencies = _dependency_pairs(_meta.field_dependencies)
+        kclass._meta.default_field = kclass.asField()
+        cls._bind_fields(kclass)
         for f, value in kclass._meta.allowed_fields_map.items():
             if hasattr(kclass, f):
                 delattr(kclass, f)
         return kclass
 
+    @staticmethod
+    def _bind_fields(kclass):
+        # Field names and defaults as used by the schema and the generated
+        # deserializer. Run again when a field changes: the class default
+        # field owns every field and is invalidated along with them.
+        _meta = kclass._meta
+        bound_fields = []
+        for attr_name, field_obj in _meta.allowed_fields_map.items():
+            # names are interned, they are looked up in every instance validated
+            fname = sys.intern(field_obj.name or attr_name)
+            bound_fields.append((fname, field_obj, field_obj.use_default))
+            field_obj._add_owner(_meta.default_field)
+        _meta.bound_fields = tuple(bound_fields)
+        _meta.deserializer = None
+
     @classmethod
     def _get_all_supers(cls, kclass):
         return [cls for cls in kclass.__mro__ if issubclass(cls, BaseObjectType)]
@@ -399,27 +748,26 @@ class ObjectType(dict, BaseObjectType, metaclass=ObjectTypeMeta):
 
     @classmethod
     def deserialize(cls, data):
-        schema_object = cls()
-        for fname, obj in schema_object._meta.allowed_fields_map.items():
-            is_missing = False
-            try:
-                v = data[obj.name or fname]
-            except KeyError:
-                if obj.use_default is not None:
-                    v = obj.use_default
-                else:
-                    is_missing = True
-            if not is_missing:
-
-                if isinstance(obj, cls.Schema):
-                    schema_object[obj.name or fname] = obj.field_class.deserialize(v)
-                elif isinstance(obj, List):
-                    schema_object[obj.name or fname] = obj.deserialize(v)
-                else:
-                    schema_object[obj.name or fname] = v
-        return schema_object
+        # generated on first use and kept on the class own _meta, subclasses
+        # have fields of their own
+        deserialize = cls._meta.deserializer
+        if deserialize is None:
+            deserialize = cls._meta.deserializer = _build_deserializer(cls)
+        return deserialize(cls, data)
+
+    @classmethod
+    def from_json(cls, data):
+        # only the top level document is parsed, nested values are never JSON
+        return cls.deserialize(cls._confirm_json_loaded(data))
 
     class Schema(BaseSchemaField):
+        __slots__ = (
+            "field_class",
+            "max_properties",
+            "min_properties",
+            "field_dependencies",
+            "additional_properties",
+        )
         JSON_SCHEMA_TYPE = "object"
 
         def __init__(
@@ -449,27 +797,33 @@ class ObjectType(dict, BaseObjectType, metaclass=ObjectTypeMeta):
             self.field_dependencies = field_dependencies or []
             self.additional_properties = additional_properties
 
+        def _invalidate(self):
+            super()._invalidate()
+            field_class = self.field_class
+            if field_class._meta.default_field is self:
+                # one of the class fields changed, its name or default may be new
+                ObjectTypeMeta._bind_fields(field_class)
+
         def to_json_schema(self):
             _meta = self.field_class._meta
             _schema = {"type": self.JSON_SCHEMA_TYPE, "properties": {}, "required": []}
-            #  __dict__ only refers currrent class not super chain.
-            for attr_name, field_obj in _meta.allowed_fields_map.items():
-                fname = field_obj.name if field_obj.name is not None else attr_name
-                _schema["properties"][fname] = field_obj.to_json_schema()
+            for fname, field_obj, _ in _meta.bound_fields:
+                _schema["properties"][fname] = self._embed(field_obj)
                 if field_obj.required:
                     _schema["required"].append(fname)
             if self.max_properties is not None:
                 _schema["maxProperties"] = self.max_properties
             if self.min_properties is not None:
                 _schema["minProperties"] = self.min_properties
-            _field_dependencies = self.field_dependencies or getattr(
-                _meta, "field_dependencies", []
+            # read here, the schema is only rebuilt when the field changes
+            _dependencies = (
+                _dependency_pairs(self.field_dependencies) or _meta.dependencies
             )
-            if _field_dependencies:
-                _schema["dependencies"] = {}
-            for d in _field_dependencies:
-                _schema["dependencies"][d.source] = d.targets
-            _schema["additionalProperties"] = self.additional_properties or getattr(
-                _meta, "additional_properties", False
+            if _dependencies:
+                _schema["dependencies"] = {
+                    source: list(targets) for source, targets in _dependencies
+                }
+            _schema["additionalProperties"] = (
+                self.additional_properties or _meta.additional_properties
             )
             return _schema
@@ -3,6 +3,7 @@ from .fields import BaseSchemaField, ObjectType
 
 
 class BaseOperatorSchemaField(BaseSchemaField):
+    __slots__ = ("_types",)
     OPERATOR = ""
 
     def __init__(self, *types, required=True, name=None, title=None, description=None):
@@ -28,25 +29,29 @@ class BaseOperatorSchemaField(BaseSchemaField):
         schema = []
         for t in self._types:
             if isinstance(t, BaseSchemaField):
-                schema.append(t.to_json_schema())
+                schema.append(self._embed(t))
             else:
                 schema.append(t)
         return {self.OPERATOR: schema}
 
 
 class AnyOf(BaseOperatorSchemaField):
+    __slots__ = ()
     OPERATOR = "anyOf"
 
 
 class AllOf(BaseOperatorSchemaField):
+    __slots__ = ()
     OPERATOR = "allOf"
 
 
 class OneOf(BaseOperatorSchemaField):
+    __slots__ = ()
     OPERATOR = "oneOf"
 
 
 class Not(BaseOperatorSchemaField):
+    __slots__ = ()
     OPERATOR = "not"
 
     def __init__(self, _type, *args, **kwargs):
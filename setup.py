@@ -19,9 +19,12 @@ setup(
     keywords=["json", "validation", "schema"],
     install_requires=[
         "jsonschema>=3.2.0",
-        "cached_property>=1.5.2",
         "strict-rfc3339",
     ],
+    extras_require={
+        "fast": ["fastjsonschema>=2.19", "orjson>=3"],
+        "rs": ["jsonschema-rs>=0.20"],
+    },
     python_requires=">=3.6",
     long_description=long_description,
     long_description_content_type="text/markdown",
@@ -0,0 +1,136 @@
+import random
+import unittest
+
+from jsonschema import Draft7Validator, draft7_format_checker
+
+from jsonene.compiler import compile_schema
+
+SCALARS = [
+    None,
+    True,
+    False,
+    0,
+    1,
+    2,
+    3,
+    1.0,
+    2.5,
+    -4,
+    10**20,
+    "",
+    "a",
+    "ab",
+    "xyz",
+    "a@b",
+    "2020-01-05",
+    "2020-02-30",
+    "1.2.3.4",
+]
+KEYS = ["a", "b", "c"]
+
+
+def random_instance(rng, depth=0):
+    roll = rng.random()
+    if depth < 3 and roll < 0.2:
+        return {
+            k: random_instance(rng, depth + 1)
+            for k in rng.sample(KEYS, rng.randint(0, 3))
+        }
+    if depth < 3 and roll < 0.4:
+        return [random_instance(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return rng.choice(SCALARS)
+
+
+def random_schema(rng, depth=0):
+    if rng.random() < 0.1:
+        return rng.choice([True, False])
+    schema = {}
+    if rng.random() < 0.5:
+        types = ["null", "boolean", "integer", "number", "string", "array", "object"]
+        picked = rng.sample(types, rng.randint(1, 3))
+        schema["type"] = picked[0] if len(picked) == 1 else picked
+    keywords = {
+        "minimum": lambda: rng.choice([0, 1, 2.5]),
+        "maximum": lambda: rng.choice([1, 3]),
+        "exclusiveMinimum": lambda: rng.choice([0, 1]),
+        "exclusiveMaximum": lambda: rng.choice([2, 3.5]),
+        "multipleOf": lambda: rng.choice([1, 2, 0.5]),
+        "minLength": lambda: rng.randint(0, 2),
+        "maxLength": lambda: rng.randint(0, 3),
+        "pattern": lambda: rng.choice(["^a", "b", "^[0-9-]+$"]),
+        "format": lambda: rng.choice(["email", "date", "ipv4"]),
+        "minItems": lambda: rng.randint(0, 2),
+        "maxItems": lambda: rng.randint(0, 3),
+        "uniqueItems": lambda: rng.choice([True, False]),
+        "minProperties": lambda: rng.randint(0, 2),
+        "maxProperties": lambda: rng.randint(0, 2),
+        "required": lambda: rng.sample(KEYS, rng.randint(0, 2)),
+        "const": lambda: random_instance(rng, 2),
+        "enum": lambda: [random_instance(rng, 2) for _ in range(rng.randint(1, 3))],
+    }
+    nested = {
+        "items": lambda: (
+            random_schema(rng, depth + 1)
+            if rng.random() < 0.7
+            else [random_schema(rng, depth + 1) for _ in range(rng.randint(1, 2))]
+        ),
+        "additionalItems": lambda: random_schema(rng, depth + 1),
+        "contains": lambda: random_schema(rng, depth + 1),
+        "properties": lambda: {
+            k: random_schema(rng, depth + 1) for k in rng.sample(KEYS, 2)
+        },
+        "additionalProperties": lambda: random_schema(rng, depth + 1),
+        "dependencies": lambda: {KEYS[0]: rng.sample(KEYS, 1)},
+        "not": lambda: random_schema(rng, depth + 1),
+        "anyOf": lambda: [random_schema(rng, depth + 1) for _ in range(2)],
+        "allOf": lambda: [random_schema(rng, depth + 1) for _ in range(2)],
+        "oneOf": lambda: [random_schema(rng, depth + 1) for _ in range(2)],
+    }
+    for name in rng.sample(sorted(keywords), rng.randint(0, 3)):
+        schema[name] = keywords[name]()
+    if depth < 2:
+        for name in rng.sample(sorted(nested), rng.randint(0, 2)):
+            schema[name] = nested[name]()
+    return schema
+
+
+class CompiledSchemaTest(unittest.TestCase):
+    def assertAgrees(self, schema, instances, check_formats=False):
+        check = compile_schema(schema, check_formats=check_formats)
+        if check is None:
+            return
+        validator = Draft7Validator(
+            schema, format_checker=draft7_format_checker if check_formats else None
+        )
+        for instance in instances:
+            if check(instance):
+                self.assertTrue(validator.is_valid(instance), (schema, instance))
+
+    def test_keywords_without_checks(self):
+        instances = [[1], [1, 1], "a", {}, {"a": 1}, 1, None]
+        for schema in [
+            {"type": ["array", "null"], "uniqueItems": False},
+            {"additionalProperties": True},
+            {"type": ["object", "string"], "required": []},
+        ]:
+            check = compile_schema(schema)
+            self.assertIsNotNone(check)
+            self.assertAgrees(schema, instances)
+
+    def test_unknown_keywords_are_ignored(self):
+        for schema in [{"$type": "string"}, {"$required": ["a"]}]:
+            check = compile_schema(schema)
+            self.assertTrue(check(1))
+            self.assertTrue(check({}))
+
+    def test_matches_draft7(self):
+        rng = random.Random(7)
+        for _ in range(1500):
+            schema = random_schema(rng)
+            instances = [random_instance(rng) for _ in range(30)]
+            self.assertAgrees(schema, instances)
+            self.assertAgrees(schema, instances, check_formats=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
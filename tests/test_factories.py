@@ -0,0 +1,43 @@
+import unittest
+
+import jsonene
+
+try:
+    from jsonene.factories import ListSchemaFactory, SchemaFactory
+except ImportError:  # factory_boy is not a dependency of jsonene
+    ListSchemaFactory = SchemaFactory = None
+
+
+@unittest.skipIf(SchemaFactory is None, "factory_boy is not installed")
+class FactoryTest(unittest.TestCase):
+    def test_schema_factory(self):
+        class Person(jsonene.ObjectType):
+            name = jsonene.String()
+
+        class PersonFactory(SchemaFactory):
+            class Meta:
+                model = Person
+
+            name = "bob"
+
+        person = PersonFactory()
+        self.assertIsInstance(person, Person)
+        self.assertEqual(person, {"name": "bob"})
+
+    def test_list_schema_factory(self):
+        class Names(jsonene.List):
+            pass
+
+        class NamesFactory(ListSchemaFactory):
+            class Meta:
+                model = Names
+
+            first = "a"
+            second = "b"
+
+        self.assertEqual(NamesFactory(), ["a", "b"])
+        self.assertEqual(NamesFactory.build(), ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import datetime
+import json
+import unittest
+
+from jsonschema.exceptions import ValidationError
+
+import jsonene
+
+
+class Address(jsonene.ObjectType):
+    city = jsonene.String()
+    zip_code = jsonene.String(required=False, name="zip")
+
+
+class Person(jsonene.ObjectType):
+    name = jsonene.String(max_len=10)
+    age = jsonene.Integer(required=False, min=0)
+    country = jsonene.String(required=False, use_default="India")
+    born = jsonene.Format(jsonene.Format.DATE, required=False)
+    address = Address.Field(required=False)
+    tags = jsonene.List(jsonene.String, required=False)
+    homes = jsonene.List(Address, required=False)
+
+
+class SubclassTest(unittest.TestCase):
+    def test_subclass_after_base_schema_is_built(self):
+        class Base(jsonene.ObjectType):
+            pass
+
+        Base().validate()
+        jsonene.ObjectType.json_schema()
+
+        class Child(Base):
+            name = jsonene.String()
+
+        self.assertEqual(list(Child._meta.allowed_fields_map), ["name"])
+        self.assertEqual(Base.json_schema()["properties"], {})
+        self.assertEqual(Child.json_schema()["required"], ["name"])
+        Child(name="a").validate()
+
+
+class FieldChangeTest(unittest.TestCase):
+    def test_field_dependencies_change(self):
+        class P(jsonene.ObjectType):
+            a = jsonene.String(required=False)
+            b = jsonene.String(required=False)
+
+        field = P.Field()
+        self.assertNotIn("dependencies", field.json_schema)
+        field.field_dependencies = [jsonene.RequiredDependency("a", ["b"])]
+        self.assertEqual(field.json_schema["dependencies"], {"a": ["b"]})
+        self.assertTrue(field.validation_errors(P(a="x")))
+
+    def test_name_and_default_change(self):
+        class Person(jsonene.ObjectType):
+            name = jsonene.String()
+            age = jsonene.Integer(required=False)
+
+        class Team(jsonene.ObjectType):
+            lead = Person.Field()
+
+        Person.deserialize({"name": "a"})
+        Team.json_schema()
+        fields = Person._meta.allowed_fields_map
+        fields["name"].name = "full_name"
+        fields["age"].use_default = 3
+        self.assertEqual(Person.json_schema()["required"], ["full_name"])
+        self.assertEqual(
+            Team.json_schema()["properties"]["lead"]["required"], ["full_name"]
+        )
+        self.assertEqual(
+            Person.deserialize({"full_name": "b"}), {"full_name": "b", "age": 3}
+        )
+
+    def test_compiled_check_follows_field_change(self):
+        class P(jsonene.ObjectType):
+            name = jsonene.String()
+
+        P(name="abcdef").validate()
+        P._meta.allowed_fields_map["name"].max_len = 2
+        with self.assertRaises(ValidationError):
+            P(name="abcdef").validate()
+
+
+class DeserializeTest(unittest.TestCase):
+    def test_nested_values(self):
+        person = Person.deserialize(
+            {
+                "name": "bob",
+                "address": {"city": "Pune", "zip": "411001"},
+                "homes": [{"city": "Goa"}],
+                "tags": ["a"],
+            }
+        )
+        self.assertIsInstance(person, Person)
+        self.assertIsInstance(person["address"], Address)
+        self.assertIsInstance(person["homes"][0], Address)
+        self.assertEqual(person["address"], {"city": "Pune", "zip": "411001"})
+        self.assertEqual(person["country"], "India")
+        self.assertNotIn("age", person)
+
+    def test_nested_strings_are_not_parsed(self):
+        person = Person.deserialize({"name": '{"a": 1}', "tags": ["[1]"]})
+        self.assertEqual(person["name"], '{"a": 1}')
+        self.assertEqual(person["tags"], ["[1]"])
+
+    def test_from_json(self):
+        document = '{"name": "bob", "address": {"city": "Pune"}}'
+        for data in (document, document.encode()):
+            person = Person.from_json(data)
+            self.assertIsInstance(person["address"], Address)
+            self.assertEqual(person["address"], {"city": "Pune"})
+
+    def test_to_json_round_trip(self):
+        person = Person(name="bob", born=datetime.date(2020, 1, 2), age=2**70)
+        dumped = person.to_json()
+        self.assertEqual(json.loads(dumped)["born"], "2020-01-02")
+        self.assertEqual(Person.from_json(dumped)["age"], 2**70)
+        Person.from_json(dumped).validate(check_formats=True)
+
+    def test_to_json_non_string_keys(self):
+        class Loose(jsonene.ObjectType):
+            class Meta:
+                additional_properties = True
+
+        loose = Loose()
+        loose[1] = "a"
+        self.assertEqual(json.loads(loose.to_json()), {"1": "a"})
+
+
+class ValidationTest(unittest.TestCase):
+    def test_messages(self):
+        self.assertEqual(Person(name="bob").validation_messages(), [])
+        self.assertEqual(
+            Person(name="bob", age=-1).validation_messages(),
+            ["-1 is less than the minimum of 0"],
+        )
+        self.assertEqual(len(Person(age=-1).validation_errors()), 2)
+
+    def test_compile(self):
+        validate = Person.compile()
+        validate(Person(name="bob"))
+        with self.assertRaises(ValidationError):
+            validate(Person(name="b" * 11))
+
+    def test_iter_errors_batch(self):
+        field = jsonene.String(max_len=2)
+        errors = list(field.iter_errors_batch(["a", "abc", 1]))
+        self.assertEqual([len(e) for e in errors], [0, 1, 1])
+
+    def test_date_format(self):
+        valid = [datetime.date(2020, 1, 2), "2020-01-02", "2020-1-05"]
+        invalid = [datetime.datetime(2020, 1, 2, 3, 4), "2020-02-30", "x"]
+        for value in valid:
+            Person(name="bob", born=value).validate(check_formats=True)
+        for value in invalid:
+            with self.assertRaises(ValidationError):
+                Person(name="bob", born=value).validate(check_formats=True)
+        # formats are only checked on request
+        Person(name="bob", born="x").validate()
+
+
+if __name__ == "__main__":
+    unittest.main()